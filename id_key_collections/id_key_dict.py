@@ -1,9 +1,45 @@
 """Contains the IdKeyDict class."""
 
-from typing import Dict, Generic, Iterator, MutableMapping, Optional, Tuple, TypeVar
+import sys
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Dict,
+    Generic,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    ValuesView,
+    overload,
+)
+
+if TYPE_CHECKING:
+    from _typeshed import SupportsKeysAndGetItem
 
 _TKey = TypeVar("_TKey")
 _TValue = TypeVar("_TValue")
+_TDefault = TypeVar("_TDefault")
+
+_MISSING = object()
+"""Sentinel for arguments that were not provided."""
+
+_first = itemgetter(0)
+"""Get the key from a stored key-value pair."""
+
+_second = itemgetter(1)
+"""Get the value from a stored key-value pair."""
+
+_ITEM_OVERHEAD = sys.getsizeof((None, None)) + sys.getsizeof(id(_MISSING))
+"""The memory, in bytes, of the key-value pair and object ID stored for every item."""
 
 
 class IdKeyDict(MutableMapping[_TKey, _TValue], Generic[_TKey, _TValue]):
@@ -14,16 +50,31 @@ class IdKeyDict(MutableMapping[_TKey, _TValue], Generic[_TKey, _TValue]):
     Key objects are explicitly stored to prevent garbage collection.
     """
 
-    _inner_mapping: Dict[int, _TValue]
-    """The internal mapping of object IDs to values."""
+    __slots__ = ("_inner_mapping", "__weakref__")
 
-    _id_to_obj: Dict[int, _TKey]
-    """A mapping from object IDs to the original keys."""
+    _inner_mapping: Dict[int, Tuple[_TKey, _TValue]]
+    """The internal mapping of object IDs to key-value pairs."""
 
-    def __init__(self) -> None:
-        """Initialize an empty IdKeyDict instance."""
-        self._inner_mapping = {}
-        self._id_to_obj = {}
+    def __init__(
+        self,
+        init: Union[
+            "SupportsKeysAndGetItem[_TKey, _TValue]",
+            Iterable[Tuple[_TKey, _TValue]],
+            None,
+        ] = None,
+        /,
+    ) -> None:
+        """
+        Initialize an IdKeyDict instance.
+
+        :param init: A mapping or iterable of key-value pairs to fill the Dictionary with. If not provided, the Dictionary starts empty.
+        """
+        if init is None:
+            self._inner_mapping = {}
+        elif type(init) is IdKeyDict:
+            self._inner_mapping = init._inner_mapping.copy()
+        else:
+            self._inner_mapping = _to_inner_mapping(init)
 
     def __setitem__(self, key: _TKey, value: _TValue) -> None:
         """
@@ -32,9 +83,7 @@ class IdKeyDict(MutableMapping[_TKey, _TValue], Generic[_TKey, _TValue]):
         :param key: The key for which to set the value.
         :param value: The value to set.
         """
-        obj_id = id(key)
-        self._inner_mapping[obj_id] = value
-        self._id_to_obj[obj_id] = key
+        self._inner_mapping[id(key)] = (key, value)
 
     def __getitem__(self, key: _TKey) -> _TValue:
         """
@@ -43,7 +92,7 @@ class IdKeyDict(MutableMapping[_TKey, _TValue], Generic[_TKey, _TValue]):
         :param key: The key to look up.
         :returns: The value associated with the key.
         """
-        return self._inner_mapping[id(key)]
+        return self._inner_mapping[id(key)][1]
 
     def __delitem__(self, key: _TKey) -> None:
         """
@@ -51,9 +100,7 @@ class IdKeyDict(MutableMapping[_TKey, _TValue], Generic[_TKey, _TValue]):
 
         :param key: The key of the item to delete.
         """
-        obj_id = id(key)
-        del self._inner_mapping[obj_id]
-        del self._id_to_obj[obj_id]
+        del self._inner_mapping[id(key)]
 
     def __contains__(self, key: object) -> bool:
         """
@@ -72,41 +119,65 @@ class IdKeyDict(MutableMapping[_TKey, _TValue], Generic[_TKey, _TValue]):
         """
         return len(self._inner_mapping)
 
+    def __eq__(self, other: object) -> bool:
+        """
+        Check if this Dictionary equals another mapping.
+
+        Two IdKeyDicts are equal if they contain the same key objects, with equal values.
+
+        :param other: The mapping to compare with.
+        :returns: True if the mappings are equal, False otherwise.
+        """
+        if type(other) is IdKeyDict:
+            return self._inner_mapping == other._inner_mapping
+        return super().__eq__(other)
+
+    def __sizeof__(self) -> int:
+        """
+        Get the size of the Dictionary in memory, in bytes.
+
+        This includes the internal mapping and the key-value pair and object ID stored for every item, but, like for a standard Dictionary, not the keys and values themselves.
+
+        :returns: The size in bytes.
+        """
+        inner = self._inner_mapping
+        return (
+            object.__sizeof__(self) + sys.getsizeof(inner) + len(inner) * _ITEM_OVERHEAD
+        )
+
     def __iter__(self) -> Iterator[_TKey]:
         """
         Get an iterator over the keys.
 
         :returns: An iterator over the keys.
         """
-        return iter(self._id_to_obj.values())
+        return map(_first, self._inner_mapping.values())
 
-    def keys(  # type:ignore # According to MutableMapping this should return KeysView[_TKey], but I currently don't understand how I would implement that.
-        self,
-    ) -> Iterator[_TKey]:
+    def keys(self) -> KeysView[_TKey]:
         """
-        Get an iterator over the keys.
+        Get a view on the keys.
 
-        :returns: An iterator over the keys.
+        :returns: A view on the keys.
         """
-        return iter(self._id_to_obj.values())
+        return _IdKeyDictKeysView(self)
 
-    def values(self) -> Iterator[_TValue]:  # type: ignore # Same as `keys`
+    def values(self) -> ValuesView[_TValue]:
         """
-        Get an iterator over the values.
+        Get a view on the values.
 
-        :returns: An iterator over the values.
+        :returns: A view on the values.
         """
-        return (v for v in self._inner_mapping.values())
+        return _IdKeyDictValuesView(self)
 
-    def items(self) -> Iterator[Tuple[_TKey, _TValue]]:  # type: ignore # Same as `keys`.
+    def items(self) -> ItemsView[_TKey, _TValue]:
         """
-        Get an iterator over the items.
+        Get a view on the items.
 
         Items are key-value pairs.
 
-        :returns: An iterator over the items.
+        :returns: A view on the items.
         """
-        return ((self._id_to_obj[k], v) for k, v in self._inner_mapping.items())
+        return _IdKeyDictItemsView(self)
 
     def get(self, key: _TKey) -> Optional[_TValue]:  # type: ignore # I don't fully understand the mypy error, but I think the problem is that I don't override all function signatures.
         """
@@ -115,4 +186,349 @@ class IdKeyDict(MutableMapping[_TKey, _TValue], Generic[_TKey, _TValue]):
         :param key: The key to look up.
         :returns: The value associated with the key or None if the key is not found.
         """
-        return self._inner_mapping.get(id(key))
+        kv = self._inner_mapping.get(id(key))
+        return None if kv is None else kv[1]
+
+    def __or__(self, other: "IdKeyDict[_TKey, _TValue]") -> "IdKeyDict[_TKey, _TValue]":
+        """
+        Merge with another IdKeyDict into a new IdKeyDict.
+
+        Items of the other IdKeyDict take precedence.
+
+        :param other: The IdKeyDict to merge with.
+        :returns: The merged IdKeyDict.
+        """
+        if not isinstance(other, IdKeyDict):
+            return NotImplemented
+        new = IdKeyDict.__new__(IdKeyDict)
+        new._inner_mapping = self._inner_mapping.copy()
+        if type(other) is IdKeyDict:
+            new._inner_mapping.update(other._inner_mapping)
+        else:
+            new.update(other)
+        return new
+
+    def __ior__(
+        self,
+        other: Union[
+            "SupportsKeysAndGetItem[_TKey, _TValue]", Iterable[Tuple[_TKey, _TValue]]
+        ],
+    ) -> "IdKeyDict[_TKey, _TValue]":
+        """
+        Update the Dictionary in place with the items of another mapping or iterable of key-value pairs.
+
+        :param other: The mapping or iterable of key-value pairs to insert.
+        :returns: This IdKeyDict.
+        """
+        self.update(other)
+        return self
+
+    def copy(self) -> "IdKeyDict[_TKey, _TValue]":
+        """
+        Create a shallow copy of the Dictionary.
+
+        :returns: The copy.
+        """
+        new = IdKeyDict.__new__(IdKeyDict)
+        new._inner_mapping = self._inner_mapping.copy()
+        return new
+
+    def getmany(self, keys: Iterable[_TKey]) -> List[_TValue]:
+        """
+        Retrieve the values for multiple keys at once.
+
+        Faster than looking up the keys one by one, as it does not go through `__getitem__` for every key.
+
+        :param keys: The keys to look up.
+        :returns: The values associated with the keys, in the same order.
+        """
+        inner = self._inner_mapping
+        return [inner[id(key)][1] for key in keys]
+
+    def clear(self) -> None:
+        """Remove all items from the Dictionary."""
+        self._inner_mapping.clear()
+
+    @overload
+    def pop(self, key: _TKey) -> _TValue:
+        ...
+
+    @overload
+    def pop(
+        self, key: _TKey, default: Union[_TValue, _TDefault]
+    ) -> Union[_TValue, _TDefault]:
+        ...
+
+    def pop(self, key: _TKey, default: Any = _MISSING) -> Any:
+        """
+        Remove the item with the given key and return its value.
+
+        :param key: The key of the item to remove.
+        :param default: The value to return if the key is not found. If not provided, a KeyError is raised instead.
+        :returns: The value associated with the key, or the default if the key is not found.
+        """
+        if default is _MISSING:
+            return self._inner_mapping.pop(id(key))[1]
+        kv = self._inner_mapping.pop(id(key), None)
+        return default if kv is None else kv[1]
+
+    def popitem(self) -> Tuple[_TKey, _TValue]:
+        """
+        Remove and return the most recently inserted item.
+
+        :returns: The removed key-value pair.
+        """
+        return self._inner_mapping.popitem()[1]
+
+    def setdefault(self, key: _TKey, default: _TValue = None) -> _TValue:  # type: ignore # MutableMapping only allows the None default if the value type is optional, which requires self-type overloads.
+        """
+        Get the value for a given key, inserting the default if the key is not found.
+
+        :param key: The key to look up.
+        :param default: The value to insert if the key is not found.
+        :returns: The value associated with the key.
+        """
+        return self._inner_mapping.setdefault(id(key), (key, default))[1]
+
+    @overload
+    def update(
+        self, other: "SupportsKeysAndGetItem[_TKey, _TValue]", /, **kwargs: _TValue
+    ) -> None:
+        ...
+
+    @overload
+    def update(
+        self, other: Iterable[Tuple[_TKey, _TValue]], /, **kwargs: _TValue
+    ) -> None:
+        ...
+
+    @overload
+    def update(self, /, **kwargs: _TValue) -> None:
+        ...
+
+    def update(self, other: Any = (), /, **kwargs: _TValue) -> None:
+        """
+        Update the Dictionary with the items of another mapping or iterable of key-value pairs.
+
+        :param other: The mapping or iterable of key-value pairs to insert.
+        :param kwargs: Additional items to insert, keyed by their argument names.
+        """
+        inner = self._inner_mapping
+        if type(other) is IdKeyDict:
+            inner.update(other._inner_mapping)
+        else:
+            inner.update(_to_inner_mapping(other))
+        if kwargs:
+            inner.update({id(key): (key, value) for key, value in kwargs.items()})  # type: ignore # Keyword arguments only make sense if the key type is str.
+
+
+def _to_inner_mapping(other: Any) -> Dict[int, Tuple[Any, Any]]:
+    """
+    Build the internal mapping of an IdKeyDict from a mapping or iterable of key-value pairs.
+
+    :param other: The mapping or iterable of key-value pairs.
+    :returns: The mapping of object IDs to key-value pairs.
+    """
+    if hasattr(other, "keys"):
+        return {id(key): (key, other[key]) for key in other.keys()}
+    return {id(key): (key, value) for key, value in other}
+
+
+class _IdKeyDictKeysView(KeysView[_TKey]):
+    """A view on the keys of an IdKeyDict."""
+
+    __slots__ = ()
+
+    _mapping: IdKeyDict[_TKey, Any]
+
+    def __len__(self) -> int:
+        """
+        Get the number of keys.
+
+        :returns: The number of keys.
+        """
+        return len(self._mapping._inner_mapping)
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Check if the key is in the view.
+
+        :param key: The key to check.
+        :returns: True if key is in the view, False otherwise.
+        """
+        return id(key) in self._mapping._inner_mapping
+
+    def __iter__(self) -> Iterator[_TKey]:
+        """
+        Get an iterator over the keys.
+
+        :returns: An iterator over the keys.
+        """
+        return map(_first, self._mapping._inner_mapping.values())
+
+    def __and__(self, other: Iterable[Any]) -> AbstractSet[_TKey]:  # type: ignore # KeysView returns a set, but a set would compare keys by hash instead of id.
+        """
+        Get the keys that are in both this view and another iterable.
+
+        If the other iterable is also a view on the keys of an IdKeyDict, keys are compared by id and the result is such a view as well.
+
+        :param other: The iterable to intersect with.
+        :returns: The keys in both.
+        """
+        if type(other) is _IdKeyDictKeysView:
+            smaller = self._mapping._inner_mapping
+            larger = other._mapping._inner_mapping
+            if len(smaller) > len(larger):
+                smaller, larger = larger, smaller
+            new = IdKeyDict.__new__(IdKeyDict)
+            new._inner_mapping = {
+                obj_id: kv for obj_id, kv in smaller.items() if obj_id in larger
+            }
+            return new.keys()
+        return super().__and__(other)
+
+    def __sub__(self, other: Iterable[Any]) -> AbstractSet[_TKey]:  # type: ignore # Same as `__and__`.
+        """
+        Get the keys that are in this view but not in another iterable.
+
+        If the other iterable is also a view on the keys of an IdKeyDict, keys are compared by id and the result is such a view as well.
+
+        :param other: The iterable to subtract.
+        :returns: The keys only in this view.
+        """
+        if type(other) is _IdKeyDictKeysView:
+            other_inner = other._mapping._inner_mapping
+            new = IdKeyDict.__new__(IdKeyDict)
+            new._inner_mapping = {
+                obj_id: kv
+                for obj_id, kv in self._mapping._inner_mapping.items()
+                if obj_id not in other_inner
+            }
+            return new.keys()
+        return super().__sub__(other)
+
+    def __le__(self, other: AbstractSet[Any]) -> bool:
+        """
+        Check if every key in this view is also in another set.
+
+        :param other: The set to compare with.
+        :returns: True if this view is a subset of the other set, False otherwise.
+        """
+        if type(other) is _IdKeyDictKeysView:
+            return (
+                self._mapping._inner_mapping.keys()
+                <= other._mapping._inner_mapping.keys()
+            )
+        return super().__le__(other)
+
+    def __lt__(self, other: AbstractSet[Any]) -> bool:
+        """
+        Check if this view is a proper subset of another set.
+
+        :param other: The set to compare with.
+        :returns: True if this view is a proper subset of the other set, False otherwise.
+        """
+        if type(other) is _IdKeyDictKeysView:
+            return (
+                self._mapping._inner_mapping.keys()
+                < other._mapping._inner_mapping.keys()
+            )
+        return super().__lt__(other)
+
+    def __ge__(self, other: AbstractSet[Any]) -> bool:
+        """
+        Check if every key in another set is also in this view.
+
+        :param other: The set to compare with.
+        :returns: True if this view is a superset of the other set, False otherwise.
+        """
+        if type(other) is _IdKeyDictKeysView:
+            return (
+                self._mapping._inner_mapping.keys()
+                >= other._mapping._inner_mapping.keys()
+            )
+        return super().__ge__(other)
+
+    def __gt__(self, other: AbstractSet[Any]) -> bool:
+        """
+        Check if this view is a proper superset of another set.
+
+        :param other: The set to compare with.
+        :returns: True if this view is a proper superset of the other set, False otherwise.
+        """
+        if type(other) is _IdKeyDictKeysView:
+            return (
+                self._mapping._inner_mapping.keys()
+                > other._mapping._inner_mapping.keys()
+            )
+        return super().__gt__(other)
+
+
+class _IdKeyDictValuesView(ValuesView[_TValue]):
+    """A view on the values of an IdKeyDict."""
+
+    __slots__ = ()
+
+    _mapping: IdKeyDict[Any, _TValue]
+
+    def __len__(self) -> int:
+        """
+        Get the number of values.
+
+        :returns: The number of values.
+        """
+        return len(self._mapping._inner_mapping)
+
+    def __contains__(self, value: object) -> bool:
+        """
+        Check if the value is in the view.
+
+        :param value: The value to check.
+        :returns: True if value is in the view, False otherwise.
+        """
+        return value in map(_second, self._mapping._inner_mapping.values())
+
+    def __iter__(self) -> Iterator[_TValue]:
+        """
+        Get an iterator over the values.
+
+        :returns: An iterator over the values.
+        """
+        return map(_second, self._mapping._inner_mapping.values())
+
+
+class _IdKeyDictItemsView(ItemsView[_TKey, _TValue]):
+    """A view on the items of an IdKeyDict."""
+
+    __slots__ = ()
+
+    _mapping: IdKeyDict[_TKey, _TValue]
+
+    def __len__(self) -> int:
+        """
+        Get the number of items.
+
+        :returns: The number of items.
+        """
+        return len(self._mapping._inner_mapping)
+
+    def __contains__(self, item: object) -> bool:
+        """
+        Check if the item is in the view.
+
+        :param item: The key-value pair to check.
+        :returns: True if item is in the view, False otherwise.
+        """
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+        key, value = item
+        kv = self._mapping._inner_mapping.get(id(key))
+        return kv is not None and (kv[1] is value or kv[1] == value)
+
+    def __iter__(self) -> Iterator[Tuple[_TKey, _TValue]]:
+        """
+        Get an iterator over the items.
+
+        :returns: An iterator over the items.
+        """
+        return iter(self._mapping._inner_mapping.values())
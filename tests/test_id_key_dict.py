@@ -1,3 +1,6 @@
+import sys
+from typing import KeysView, List, Tuple
+
 import pytest
 from id_key_collections import IdKeyDict
 
@@ -12,6 +15,21 @@ def test_dict() -> IdKeyDict[str, float]:
     return IdKeyDict[str, float]()
 
 
+def test_init() -> None:
+    """Test the __init__ method with initial items."""
+    keys = ["key1", "key2", "key3"]
+    values = [0.1, 0.2, 0.3]
+
+    from_pairs = IdKeyDict[str, float](zip(keys, values))
+    assert set(from_pairs.items()) == set(zip(keys, values))
+    from_mapping = IdKeyDict[str, float](dict(zip(keys, values)))
+    assert set(from_mapping.items()) == set(zip(keys, values))
+    from_id_key_dict = IdKeyDict[str, float](from_pairs)
+    assert set(from_id_key_dict.items()) == set(zip(keys, values))
+    del from_id_key_dict[keys[0]]
+    assert keys[0] in from_pairs
+
+
 def test_set_and_get(test_dict: IdKeyDict[str, float]) -> None:
     """
     Test the __setitem__ and __getitem__ methods.
@@ -67,6 +85,62 @@ def test_len(test_dict: IdKeyDict[str, float]) -> None:
     assert len(test_dict) == 2
 
 
+def test_eq(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the __eq__ method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    key1 = "key1"
+    value1 = 0.1
+    value2 = 0.2
+
+    other = IdKeyDict[str, float]()
+    assert test_dict == other
+    test_dict[key1] = value1
+    assert test_dict != other
+    other[key1] = value2
+    assert test_dict != other
+    other[key1] = value1
+    assert test_dict == other
+    assert test_dict == {key1: value1}
+
+
+def test_eq_by_id() -> None:
+    """Test that the __eq__ method compares keys by id."""
+    equal1 = tuple([1])
+    equal2 = tuple([1])
+    distinct1 = IdKeyDict[Tuple[int, ...], int]([(equal1, 0)])
+    distinct2 = IdKeyDict[Tuple[int, ...], int]([(equal2, 0)])
+    assert distinct1 != distinct2
+
+    key = [1]
+    unhashable = IdKeyDict[List[int], int]([(key, 0)])
+    assert unhashable == IdKeyDict[List[int], int]([(key, 0)])
+    assert unhashable != IdKeyDict[List[int], int]([(key, 1)])
+    assert unhashable != IdKeyDict[List[int], int]([([1], 0)])
+
+
+def test_sizeof(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the __sizeof__ method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    empty_size = sys.getsizeof(test_dict)
+    pair_size = sys.getsizeof((None, None))
+
+    for i in range(10):
+        test_dict[str(i)] = float(i)
+    size_10 = sys.getsizeof(test_dict)
+    assert size_10 >= empty_size + 10 * pair_size
+
+    for i in range(10, 100):
+        test_dict[str(i)] = float(i)
+    size_100 = sys.getsizeof(test_dict)
+    assert size_100 >= size_10 + 90 * pair_size
+
+
 def test_iter(test_dict: IdKeyDict[str, float]) -> None:
     """
     Test the __iter__ method.
@@ -91,6 +165,8 @@ def test_keys(test_dict: IdKeyDict[str, float]) -> None:
     for key, value in zip(keys, values):
         test_dict[key] = value
     assert set(test_dict.keys()) == set(keys)
+    assert len(test_dict.keys()) == len(keys)
+    assert keys[0] in test_dict.keys()
 
 
 def test_values(test_dict: IdKeyDict[str, float]) -> None:
@@ -104,6 +180,8 @@ def test_values(test_dict: IdKeyDict[str, float]) -> None:
     for key, value in zip(keys, values):
         test_dict[key] = value
     assert set(test_dict.values()) == set(values)
+    assert len(test_dict.values()) == len(values)
+    assert values[0] in test_dict.values()
 
 
 def test_items(test_dict: IdKeyDict[str, float]) -> None:
@@ -117,6 +195,9 @@ def test_items(test_dict: IdKeyDict[str, float]) -> None:
     for key, value in zip(keys, values):
         test_dict[key] = value
     assert set(test_dict.items()) == set(zip(keys, values))
+    assert len(test_dict.items()) == len(keys)
+    assert (keys[0], values[0]) in test_dict.items()
+    assert (keys[0], values[1]) not in test_dict.items()
 
 
 def test_get(test_dict: IdKeyDict[str, float]) -> None:
@@ -131,3 +212,236 @@ def test_get(test_dict: IdKeyDict[str, float]) -> None:
     assert test_dict.get(key1) is None
     test_dict[key1] = value1
     assert test_dict.get(key1) == value1
+
+
+def test_getmany(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the getmany method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    keys = ["key1", "key2", "key3"]
+    values = [0.1, 0.2, 0.3]
+    for key, value in zip(keys, values):
+        test_dict[key] = value
+
+    assert test_dict.getmany(reversed(keys)) == list(reversed(values))
+    assert test_dict.getmany([]) == []
+    with pytest.raises(KeyError):
+        test_dict.getmany(["key4"])
+
+
+def test_clear(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the clear method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    key1 = "key1"
+    value1 = 0.1
+
+    test_dict[key1] = value1
+    test_dict.clear()
+    assert len(test_dict) == 0
+    assert key1 not in test_dict
+
+
+def test_pop(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the pop method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    key1 = "key1"
+    value1 = 0.1
+
+    test_dict[key1] = value1
+    assert test_dict.pop(key1) == value1
+    assert key1 not in test_dict
+    assert test_dict.pop(key1, None) is None
+    with pytest.raises(KeyError):
+        test_dict.pop(key1)
+
+
+def test_popitem(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the popitem method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    key1 = "key1"
+    value1 = 0.1
+    key2 = "key2"
+    value2 = 0.2
+
+    test_dict[key1] = value1
+    test_dict[key2] = value2
+    assert test_dict.popitem() == (key2, value2)
+    assert test_dict.popitem() == (key1, value1)
+    with pytest.raises(KeyError):
+        test_dict.popitem()
+
+
+def test_setdefault(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the setdefault method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    key1 = "key1"
+    value1 = 0.1
+    value2 = 0.2
+
+    assert test_dict.setdefault(key1, value1) == value1
+    assert test_dict.setdefault(key1, value2) == value1
+    assert test_dict[key1] == value1
+
+
+def test_update(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the update method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    keys = ["key1", "key2", "key3"]
+    values = [0.1, 0.2, 0.3]
+
+    other = IdKeyDict[str, float]()
+    other[keys[0]] = values[0]
+    test_dict.update(other)
+    test_dict.update({keys[1]: values[1]})
+    test_dict.update([(keys[2], values[2])])
+    assert set(test_dict.items()) == set(zip(keys, values))
+
+
+def test_keys_operators(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the set operators of the keys view.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    keys = ["key1", "key2", "key3"]
+    values = [0.1, 0.2, 0.3]
+    for key, value in zip(keys, values):
+        test_dict[key] = value
+
+    other = IdKeyDict[str, float]()
+    other[keys[1]] = values[1]
+    other[keys[2]] = values[2]
+    assert test_dict.keys() & other.keys() == set(keys[1:])
+    assert test_dict.keys() - other.keys() == set(keys[:1])
+    assert other.keys() - test_dict.keys() == set()
+
+
+def test_keys_operators_by_id() -> None:
+    """Test that the set operators of the keys view compare keys by id."""
+    key1 = [1]
+    key2 = [2]
+    unhashable = IdKeyDict[List[int], int]([(key1, 1), (key2, 2)])
+    other_unhashable = IdKeyDict[List[int], int]([(key2, 2)])
+    intersection = unhashable.keys() & other_unhashable.keys()
+    assert len(intersection) == 1 and key2 in intersection
+    difference = unhashable.keys() - other_unhashable.keys()
+    assert len(difference) == 1 and key1 in difference
+
+    equal1 = tuple([1, 2])
+    equal2 = tuple([1, 2])
+    distinct = IdKeyDict[Tuple[int, ...], int]([(equal1, 0), (equal2, 1)])
+    other_distinct = IdKeyDict[Tuple[int, ...], int]([(equal1, 0)])
+    assert len(distinct.keys() & distinct.keys()) == 2
+    intersection_distinct = distinct.keys() & other_distinct.keys()
+    assert len(intersection_distinct) == 1 and equal1 in intersection_distinct
+    difference_distinct = distinct.keys() - other_distinct.keys()
+    assert len(difference_distinct) == 1 and equal2 in difference_distinct
+    assert equal1 not in difference_distinct
+
+
+def test_keys_comparisons(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the subset and superset comparisons of the keys view.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    keys = ["key1", "key2", "key3"]
+    values = [0.1, 0.2, 0.3]
+    for key, value in zip(keys, values):
+        test_dict[key] = value
+
+    other = IdKeyDict[str, float]()
+    other[keys[1]] = values[1]
+    assert other.keys() <= test_dict.keys()
+    assert other.keys() < test_dict.keys()
+    assert test_dict.keys() >= other.keys()
+    assert test_dict.keys() > other.keys()
+    assert not test_dict.keys() <= other.keys()
+    assert not test_dict.keys() < test_dict.keys()
+    assert test_dict.keys() <= test_dict.keys()
+
+
+def test_copy(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the copy method.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    key1 = "key1"
+    value1 = 0.1
+
+    test_dict[key1] = value1
+    copy = test_dict.copy()
+    assert copy[key1] == value1
+    del copy[key1]
+    assert key1 in test_dict
+
+
+def test_or(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test the __or__ and __ior__ methods.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+    keys = ["key1", "key2"]
+    values = [0.1, 0.2]
+
+    test_dict[keys[0]] = values[0]
+    other = IdKeyDict[str, float]()
+    other[keys[0]] = values[1]
+    other[keys[1]] = values[1]
+    merged = test_dict | other
+    assert set(merged.items()) == {(keys[0], values[1]), (keys[1], values[1])}
+    assert len(test_dict) == 1
+
+    test_dict |= [(keys[1], values[1])]
+    assert set(test_dict.items()) == set(zip(keys, values))
+
+
+def test_or_subclass(test_dict: IdKeyDict[str, float]) -> None:
+    """
+    Test that __or__ respects an overridden keys method of an IdKeyDict subclass.
+
+    :param test_dict: An empty IdKeyDict[str, float].
+    """
+
+    class PublicIdKeyDict(IdKeyDict[str, float]):
+        """An IdKeyDict that only exposes keys that do not start with an underscore."""
+
+        def keys(self) -> KeysView[str]:
+            """
+            Get a view on the keys that do not start with an underscore.
+
+            :returns: A view on the keys.
+            """
+            return IdKeyDict[str, float](
+                (key, value) for key, value in self.items() if not key.startswith("_")
+            ).keys()
+
+    key1 = "key1"
+    value1 = 0.1
+    key2 = "_key2"
+    value2 = 0.2
+
+    other = PublicIdKeyDict()
+    other[key1] = value1
+    other[key2] = value2
+    merged = test_dict | other
+    assert set(merged.items()) == {(key1, value1)}